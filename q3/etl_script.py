@@ -8,15 +8,56 @@ Author: ETL Solution
 Date: July 2025
 """
 
+import adbc_driver_sqlite.dbapi as adbc_sqlite
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from pyarrow import parquet as pa_parquet
 import requests
-import sqlite3
-import hashlib
-from datetime import datetime
-from typing import Dict
+import xxhash
+from collections import Counter
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterator, List, Optional
 import warnings
 warnings.filterwarnings('ignore')
 
+# Columns referenced by the transform and dimensional model steps
+KEEP_COLS = [
+    'VIN (1-10)', 'County', 'City', 'State', 'Postal Code', 'Model Year', 'Make', 'Model',
+    'Electric Vehicle Type', 'Clean Alternative Fuel Vehicle (CAFV) Eligibility',
+    'Electric Range', 'Base MSRP', 'Legislative District', 'DOL Vehicle ID',
+    'Vehicle Location', 'Electric Utility', '2020 Census Tract'
+]
+
+# Explicit schema so pandas skips type inference; low-cardinality strings are
+# stored as categories since they are only used for dedup, encoding and joins
+DTYPES = {
+    'VIN (1-10)': 'category',
+    'County': 'category',
+    'City': 'category',
+    'State': 'category',
+    'Postal Code': 'category',
+    'Model Year': 'int16',
+    'Make': 'category',
+    'Model': 'category',
+    'Electric Vehicle Type': 'category',
+    'Clean Alternative Fuel Vehicle (CAFV) Eligibility': 'category',
+    'Electric Range': 'float32',
+    'Base MSRP': 'float32',
+    'Legislative District': 'category',
+    'DOL Vehicle ID': 'int64',
+    'Vehicle Location': 'category',
+    'Electric Utility': 'category',
+    '2020 Census Tract': 'category'
+}
+
+# Same schema for Arrow's CSV reader; dictionary-encoded strings become pandas categories
+ARROW_SCHEMA = {
+    col: pa.dictionary(pa.int32(), pa.string()) if dtype == 'category' else pa.from_numpy_dtype(np.dtype(dtype))
+    for col, dtype in DTYPES.items()
+}
+
 class EVDataETL:
     """
     Electric Vehicle Data ETL Pipeline
@@ -34,34 +75,49 @@ class EVDataETL:
         """
         self.data_url = data_url
         self.raw_data = None
+        self._raw_shape = None
         self.cleaned_data = None
+        self._cleaned_shape = None
         self.dimension_tables = {}
+        self._foreign_keys = {}
         self.fact_table = None
+        self._fact_shape = None
+        self._fact_parquet_path = None
 
     def extract_data(self) -> pd.DataFrame:
         """
-        Extract data from the source URL in chunks
+        Extract data from the source URL, streaming the download into the parser
 
         Returns:
-            pd.DataFrame: Concatenated electric vehicle data from all chunks
+            pd.DataFrame: Electric vehicle data
         """
-        print("Extracting data from source in chunks...")
+        print("Extracting data from source...")
 
         try:
-            # Download the dataset
-            response = requests.get(self.data_url)
-            response.raise_for_status()
-
-            # Save to temporary file
-            temp_file = 'temp_ev_data.csv'
-            with open(temp_file, 'wb') as f:
-                f.write(response.content)
-            
-            # Load into pandas DataFrame (**use chunking for processing lagre files)
-            self.raw_data = pd.read_csv('temp_ev_data.csv')
-            
-            print(f"Successfully extracted {len(self.raw_data)} records")
-            print(f"Dataset shape: {self.raw_data.shape}")
+            with self._open_source() as source:
+                # Parse with Arrow's multithreaded columnar CSV reader, converting to
+                # pandas only once the typed columns are built
+                table = pa_csv.read_csv(
+                    source,
+                    convert_options=pa_csv.ConvertOptions(
+                        include_columns=KEEP_COLS,
+                        column_types=ARROW_SCHEMA,
+                        strings_can_be_null=True
+                    )
+                )
+
+            # Free each Arrow column as soon as it is converted, so the table and the
+            # frame are never held in full at the same time; the table is unusable after
+            self.raw_data = table.to_pandas(split_blocks=True, self_destruct=True)
+            del table
+
+            self.raw_data = self._downcast_numeric_columns(self.raw_data, verbose=True)
+            self.raw_data = self._parse_vehicle_location(self.raw_data)
+
+            self._raw_shape = self.raw_data.shape
+
+            print(f"Successfully extracted {self._raw_shape[0]} records")
+            print(f"Dataset shape: {self._raw_shape}")
             print(f"Columns: {list(self.raw_data.columns)}")
             
             return self.raw_data
@@ -70,6 +126,81 @@ class EVDataETL:
             print(f"Error extracting data: {e}")
             raise
 
+    @contextmanager
+    def _open_source(self) -> Iterator[BinaryIO]:
+        """
+        Open the source URL as a decoded byte stream
+
+        The response body is never buffered in full; parsers read it incrementally,
+        so peak memory during extraction stays independent of the download size.
+
+        Yields:
+            BinaryIO: File-like stream of the CSV body
+        """
+        with requests.get(self.data_url, stream=True) as response:
+            response.raise_for_status()
+            # Let urllib3 undo any gzip/deflate transfer encoding while streaming
+            response.raw.decode_content = True
+            yield response.raw
+
+    def _downcast_numeric_columns(self, data: pd.DataFrame, verbose: bool = False) -> pd.DataFrame:
+        """
+        Shrink numeric columns to the smallest dtype that holds their values
+
+        Args:
+            data (pd.DataFrame): Freshly extracted data
+            verbose (bool): Whether to log memory usage before and after
+
+        Returns:
+            pd.DataFrame: Data with downcast numeric columns
+        """
+        downcasts = {
+            'Model Year': 'unsigned',
+            'Electric Range': 'float',
+            'Base MSRP': 'float',
+            'DOL Vehicle ID': 'unsigned'
+        }
+        numeric_cols = [col for col in downcasts if col in data.columns]
+        memory_before = data[numeric_cols].memory_usage(index=False).sum()
+
+        # Columns with missing values stay floating point; Base MSRP is kept floating even
+        # without them so its dtype (and warehouse column type) never depends on the chunk
+        for col in numeric_cols:
+            data[col] = pd.to_numeric(data[col], downcast=downcasts[col])
+
+        if verbose:
+            memory_after = data[numeric_cols].memory_usage(index=False).sum()
+            print(f"Downcast numeric columns: {memory_before / 1024**2:.2f} MB -> {memory_after / 1024**2:.2f} MB")
+
+        return data
+
+    def _parse_vehicle_location(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replace the "POINT (longitude latitude)" strings with numeric coordinates
+
+        Missing or malformed locations become NaN. Dropping the raw string keeps it
+        out of the location dimension's deduplication key.
+
+        Args:
+            data (pd.DataFrame): Freshly extracted data
+
+        Returns:
+            pd.DataFrame: Data with Longitude/Latitude instead of Vehicle Location
+        """
+        if 'Vehicle Location' not in data.columns:
+            return data
+
+        # Parse each distinct location once and expand to rows through the category codes;
+        # the trailing NaN is what code -1 (missing location) picks up
+        locations = data['Vehicle Location'].cat
+        coords = locations.categories.astype(str).str.extract(r'POINT \(([-\d.]+) ([-\d.]+)\)')
+        codes = locations.codes.to_numpy()
+        for axis, col in enumerate(['Longitude', 'Latitude']):
+            values = pd.to_numeric(coords[axis], errors='coerce').to_numpy('float64')
+            data[col] = np.append(values, np.nan)[codes]
+
+        return data.drop(columns=['Vehicle Location'])
+
     def explore_data(self) -> None:
         """
         Explore and analyze the dataset characteristics
@@ -84,95 +215,79 @@ class EVDataETL:
         # Basic information
         print(f"Dataset Info:")
         print(f"- Shape: {self.raw_data.shape}")
-        print(f"- Memory usage: {self.raw_data.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+        # String columns are categorical, so the shallow estimate already covers them
+        print(f"- Memory usage: {self.raw_data.memory_usage().sum() / 1024**2:.2f} MB")
 
         # Missing values analysis
+        self._print_missing_values(self.raw_data.isnull().sum(), len(self.raw_data))
+
+        # Analyze three key features as required
+        self._analyze_features()
+
+    def _print_missing_values(self, missing_data: pd.Series, total_rows: int) -> None:
+        """Print the count and percentage of missing values per column"""
         print(f"\nMissing Values Analysis:")
-        missing_data = self.raw_data.isnull().sum()
-        missing_percent = (missing_data / len(self.raw_data)) * 100
+        missing_percent = (missing_data / total_rows) * 100
         missing_df = pd.DataFrame({
             'Missing Count': missing_data,
             'Missing Percentage': missing_percent
         }).sort_values('Missing Count', ascending=False)
         print(missing_df[missing_df['Missing Count'] > 0])
 
-        # Analyze three key features as required
-        self._analyze_model_year()
-        self._analyze_electric_range()
-        self._analyze_base_msrp()
-
-    def _analyze_model_year(self) -> None:
-        """Analyze Model Year characteristics"""
-        print(f"\nMODEL YEAR ANALYSIS")
-        print("-" * 30)
-
-        model_year = self.raw_data['Model Year'].dropna()
-
-        print(f"Central Tendency:")
-        print(f"- Mean: {model_year.mean():.2f}")
-        print(f"- Median: {model_year.median():.2f}")
-        print(f"- Mode: {model_year.mode().iloc[0] if len(model_year.mode()) > 0 else 'N/A'}")
-
-        print(f"\nDistribution:")
-        print(f"- Range: {model_year.min()} - {model_year.max()}")
-        print(f"- IQR: {model_year.quantile(0.75) - model_year.quantile(0.25):.2f}")
-
-        print(f"\nDispersion:")
-        print(f"- Standard Deviation: {model_year.std():.2f}")
-        print(f"- Variance: {model_year.var():.2f}")
-        print(f"- Coefficient of Variation: {(model_year.std() / model_year.mean()) * 100:.2f}%")
-
-    def _analyze_electric_range(self) -> None:
-        """Analyze Electric Range characteristics"""
-        print(f"\nELECTRIC RANGE ANALYSIS")
+    def _analyze_features(self) -> None:
+        """Analyze Model Year, Electric Range and Base MSRP characteristics"""
+        electric_range = self.raw_data['Electric Range']
+        base_msrp = self.raw_data['Base MSRP']
+
+        # Zero range/price means "not reported", so exclude it from the statistics
+        features = {
+            'Model Year': self.raw_data['Model Year'],
+            'Electric Range': electric_range.where(electric_range > 0),
+            'Base MSRP': base_msrp.where(base_msrp > 0)
+        }
+
+        # One reduction per statistic across all three features; min/max are taken from
+        # the original columns below so the range prints in the source dtype
+        feature_data = pd.DataFrame(features).astype('float64')
+        summary = feature_data.agg(['count', 'mean', 'median', 'std', 'var'])
+        quartiles = feature_data.quantile([0.25, 0.75])
+
+        for col, values in features.items():
+            stats = summary[col].to_dict()
+            stats['q1'], stats['q3'] = quartiles[col]
+            stats['mode'] = values.value_counts().idxmax() if stats['count'] > 0 else None
+            stats['min'], stats['max'] = values.min(), values.max()
+            self._print_feature_stats(col, stats)
+
+    def _print_feature_stats(self, col: str, stats: Dict) -> None:
+        """Print central tendency, distribution and dispersion of a feature"""
+        # Range format per feature, so the min/max print the same whatever their dtype
+        prefix, suffix, range_format = {
+            'Model Year': ('', '', '.0f'),
+            'Electric Range': ('', ' miles', '.1f'),
+            'Base MSRP': ('$', '', '.2f')
+        }[col]
+
+        print(f"\n{col.upper()} ANALYSIS")
         print("-" * 30)
 
-        electric_range = self.raw_data['Electric Range'].dropna()
-        electric_range = electric_range[electric_range > 0]  # Remove zero values
-
-        if len(electric_range) == 0:
-            print("No valid electric range data available")
+        if stats['count'] == 0:
+            print(f"No valid {col} data available")
             return
 
         print(f"Central Tendency:")
-        print(f"- Mean: {electric_range.mean():.2f} miles")
-        print(f"- Median: {electric_range.median():.2f} miles")
-        print(f"- Mode: {electric_range.mode().iloc[0] if len(electric_range.mode()) > 0 else 'N/A'} miles")
+        print(f"- Mean: {prefix}{stats['mean']:.2f}{suffix}")
+        print(f"- Median: {prefix}{stats['median']:.2f}{suffix}")
+        print(f"- Mode: {prefix}{stats['mode']}{suffix}")
 
         print(f"\nDistribution:")
-        print(f"- Range: {electric_range.min()} - {electric_range.max()} miles")
-        print(f"- IQR: {electric_range.quantile(0.75) - electric_range.quantile(0.25):.2f} miles")
+        print(f"- Range: {prefix}{stats['min']:{range_format}} - {prefix}{stats['max']:{range_format}}{suffix}")
+        print(f"- IQR: {prefix}{stats['q3'] - stats['q1']:.2f}{suffix}")
 
         print(f"\nDispersion:")
-        print(f"- Standard Deviation: {electric_range.std():.2f}")
-        print(f"- Variance: {electric_range.var():.2f}")
-        print(f"- Coefficient of Variation: {(electric_range.std() / electric_range.mean()) * 100:.2f}%")
-
-    def _analyze_base_msrp(self) -> None:
-        """Analyze Base MSRP characteristics"""
-        print(f"\nBASE MSRP ANALYSIS")
-        print("-" * 30)
-
-        base_msrp = self.raw_data['Base MSRP'].dropna()
-        base_msrp = base_msrp[base_msrp > 0]  # Remove zero values
-
-        if len(base_msrp) == 0:
-            print("No valid Base MSRP data available")
-            return
-
-        print(f"Central Tendency:")
-        print(f"- Mean: ${base_msrp.mean():.2f}")
-        print(f"- Median: ${base_msrp.median():.2f}")
-        print(f"- Mode: ${base_msrp.mode().iloc[0] if len(base_msrp.mode()) > 0 else 'N/A'}")
-
-        print(f"\nDistribution:")
-        print(f"- Range: ${base_msrp.min():.2f} - ${base_msrp.max():.2f}")
-        print(f"- IQR: ${base_msrp.quantile(0.75) - base_msrp.quantile(0.25):.2f}")
-
-        print(f"\nDispersion:")
-        print(f"- Standard Deviation: ${base_msrp.std():.2f}")
-        print(f"- Variance: ${base_msrp.var():.2f}")
-        print(f"- Coefficient of Variation: {(base_msrp.std() / base_msrp.mean()) * 100:.2f}%")
+        print(f"- Standard Deviation: {prefix}{stats['std']:.2f}")
+        print(f"- Variance: {prefix}{stats['var']:.2f}")
+        print(f"- Coefficient of Variation: {(stats['std'] / stats['mean']) * 100:.2f}%")
 
     def clean_and_transform(self) -> pd.DataFrame:
         """
@@ -187,8 +302,10 @@ class EVDataETL:
         if self.raw_data is None:
             raise ValueError("No raw data available. Please extract data first.")
 
-        # Create a copy for transformation
-        self.cleaned_data = self.raw_data.copy()
+        # Transform the extracted frame in place; only its shape is kept for reporting
+        self._raw_shape = self.raw_data.shape
+        self.cleaned_data = self.raw_data
+        self.raw_data = None
 
         # Handle missing values consistently
         self._handle_missing_values()
@@ -199,7 +316,8 @@ class EVDataETL:
         # Create additional derived fields
         self._create_derived_fields()
 
-        print(f"Data cleaning completed. Final shape: {self.cleaned_data.shape}")
+        self._cleaned_shape = self.cleaned_data.shape
+        print(f"Data cleaning completed. Final shape: {self._cleaned_shape}")
         return self.cleaned_data
 
     def _handle_missing_values(self) -> None:
@@ -211,87 +329,105 @@ class EVDataETL:
         # 1. Categorical variables - fill with 'Unknown'
         categorical_cols = ['County', 'City', 'Make', 'Model', 'Electric Vehicle Type',
                             'Clean Alternative Fuel Vehicle (CAFV) Eligibility', 'Electric Utility']
-
-        for col in categorical_cols:
-            if col in self.cleaned_data.columns:
-                missing_count = self.cleaned_data[col].isnull().sum()
-                if missing_count > 0:
-                    self.cleaned_data[col] = self.cleaned_data[col].fillna('Unknown')
-                    print(f"  - {col}: Filled {missing_count} missing values with 'Unknown'")
+        fill_map = {col: 'Unknown' for col in categorical_cols if col in self.cleaned_data.columns}
 
         # 2. Numeric variables - fill with median for skewed distributions, mean for normal
         if 'Electric Range' in self.cleaned_data.columns:
-            electric_range_median = self.cleaned_data['Electric Range'].median()
-            missing_count = self.cleaned_data['Electric Range'].isnull().sum()
-            self.cleaned_data['Electric Range'] = self.cleaned_data['Electric Range'].fillna(electric_range_median)
-            print(f"  - Electric Range: Filled {missing_count} missing values with median ({electric_range_median})")
+            fill_map['Electric Range'] = self.cleaned_data['Electric Range'].median()
 
         if 'Base MSRP' in self.cleaned_data.columns:
             # For MSRP, use 0 to indicate unknown/unavailable pricing
-            missing_count = self.cleaned_data['Base MSRP'].isnull().sum()
-            self.cleaned_data['Base MSRP'] = self.cleaned_data['Base MSRP'].fillna(0)
-            print(f"  - Base MSRP: Filled {missing_count} missing values with 0 (unknown pricing)")
+            fill_map['Base MSRP'] = 0
 
-        # 3. Geographic data - forward fill or use 'Unknown'
+        # 3. Geographic data - use 'Unknown'
         geo_cols = ['Postal Code', 'Legislative District', '2020 Census Tract']
-        for col in geo_cols:
-            if col in self.cleaned_data.columns:
-                missing_count = self.cleaned_data[col].isnull().sum()
+        fill_map.update({col: 'Unknown' for col in geo_cols if col in self.cleaned_data.columns})
+
+        # Count missing values for all columns in a single reduction
+        missing_counts = self.cleaned_data[list(fill_map)].isna().sum()
+
+        for col, missing_count in missing_counts.items():
+            if col == 'Electric Range':
+                print(f"  - Electric Range: Filled {missing_count} missing values with median ({fill_map[col]})")
+            elif col == 'Base MSRP':
+                print(f"  - Base MSRP: Filled {missing_count} missing values with 0 (unknown pricing)")
+            else:
+                self._add_unknown_category(col)
                 if missing_count > 0:
-                    self.cleaned_data[col] = self.cleaned_data[col].fillna('Unknown')
                     print(f"  - {col}: Filled {missing_count} missing values with 'Unknown'")
 
+        # Fill every column in one pass
+        self.cleaned_data = self.cleaned_data.fillna(fill_map)
+
+    def _add_unknown_category(self, col: str) -> None:
+        """Register 'Unknown' as a valid category so categorical columns can be filled"""
+        column = self.cleaned_data[col]
+        if isinstance(column.dtype, pd.CategoricalDtype) and 'Unknown' not in column.cat.categories:
+            self.cleaned_data[col] = column.cat.add_categories('Unknown')
+
     def _encode_categorical_variables(self) -> None:
         """Encode categorical variables to optimize storage"""
         print("Encoding categorical variables...")
 
         # Encode Electric Vehicle Type (BEV=1, PHEV=2, Unknown=0)
         if 'Electric Vehicle Type' in self.cleaned_data.columns:
-            ev_type_mapping = {
-                'Battery Electric Vehicle (BEV)': 1,
-                'Plug-in Hybrid Electric Vehicle (PHEV)': 2,
-                'Unknown': 0
-            }
-            self.cleaned_data['EV_Type_Code'] = self.cleaned_data['Electric Vehicle Type'].map(ev_type_mapping)
-            self.cleaned_data['EV_Type_Code'] = self.cleaned_data['EV_Type_Code'].fillna(0).astype(int)
+            # Category position is the code; unmapped values (-1) fall back to Unknown
+            ev_type_categories = [
+                'Unknown',
+                'Battery Electric Vehicle (BEV)',
+                'Plug-in Hybrid Electric Vehicle (PHEV)'
+            ]
+            self.cleaned_data['EV_Type_Code'] = self._category_codes('Electric Vehicle Type', ev_type_categories)
             print(f"  - Electric Vehicle Type encoded as EV_Type_Code (BEV=1, PHEV=2, Unknown=0)")
 
         # Encode CAFV Eligibility (Eligible=1, Not Eligible=2, Unknown=0)
         if 'Clean Alternative Fuel Vehicle (CAFV) Eligibility' in self.cleaned_data.columns:
-            cafv_mapping = {
-                'Clean Alternative Fuel Vehicle Eligible': 1,
-                'Not eligible due to low battery range': 2,
-                'Eligibility unknown as battery range has not been researched': 3,
-                'Unknown': 0
-            }
-            self.cleaned_data['CAFV_Code'] = self.cleaned_data['Clean Alternative Fuel Vehicle (CAFV) Eligibility'].map(cafv_mapping)
-            self.cleaned_data['CAFV_Code'] = self.cleaned_data['CAFV_Code'].fillna(0).astype(int)
+            cafv_categories = [
+                'Unknown',
+                'Clean Alternative Fuel Vehicle Eligible',
+                'Not eligible due to low battery range',
+                'Eligibility unknown as battery range has not been researched'
+            ]
+            self.cleaned_data['CAFV_Code'] = self._category_codes(
+                'Clean Alternative Fuel Vehicle (CAFV) Eligibility', cafv_categories
+            )
             print(f"  - CAFV Eligibility encoded as CAFV_Code (Eligible=1, Low Range=2, Unknown Research=3, Unknown=0)")
 
+    def _category_codes(self, col: str, categories: List[str]) -> np.ndarray:
+        """Encode a column as int8 codes given by each value's position in categories (0 if unmapped)"""
+        codes = pd.Categorical(self.cleaned_data[col], categories=categories).codes
+        return np.where(codes < 0, 0, codes).astype('int8')
+
     def _create_derived_fields(self) -> None:
         """Create additional derived fields for analysis"""
         print("Creating derived fields...")
 
         # Create decade grouping for Model Year
         if 'Model Year' in self.cleaned_data.columns:
-            self.cleaned_data['Model_Decade'] = (self.cleaned_data['Model Year'] // 10) * 10
+            # Arrow hands a Model Year column with nulls over as float64; a nullable UInt16
+            # keeps the uint16 arithmetic while missing years stay missing
+            years = self.cleaned_data['Model Year'].astype('UInt16')
+            self.cleaned_data['Model Year'] = years
+            self.cleaned_data['Model_Decade'] = (years // 10) * 10
             print(f"  - Created Model_Decade field")
 
-        # Create year category
-        current_year = datetime.now().year
+        # Create year category (bins: <=2015, 2016-2020, >=2021)
         if 'Model Year' in self.cleaned_data.columns:
-            self.cleaned_data['Year_Category'] = pd.cut(
-                self.cleaned_data['Model Year'],
-                bins=[0, 2015, 2020, current_year + 1],
-                labels=['Pre-2015', '2015-2020', '2021+'],
-                include_lowest=True
+            years = self.cleaned_data['Model Year']
+            year_bins = np.digitize(years.to_numpy('int16', na_value=0), bins=np.array([2016, 2021], dtype='int16'))
+            self.cleaned_data['Year_Category'] = pd.Categorical.from_codes(
+                np.where(years.isna(), -1, year_bins), categories=['Pre-2015', '2015-2020', '2021+']
             )
             print(f"  - Created Year_Category field")
 
         # Hash VIN for privacy (keep first 3 chars + hash for tracking)
         if 'VIN (1-10)' in self.cleaned_data.columns:
-            self.cleaned_data['VIN_Hash'] = self.cleaned_data['VIN (1-10)'].apply(
-                lambda x: hashlib.md5(str(x).encode()).hexdigest()[:10] if pd.notna(x) else 'Unknown'
+            # VINs repeat heavily, so hash each distinct value once and map it back
+            unique_vins = self.cleaned_data['VIN (1-10)'].dropna().unique()
+            # Non-cryptographic 64-bit hash: the 10-hex-digit tag is a tracking key, not a secret
+            vin_hashes = {vin: xxhash.xxh3_64_hexdigest(str(vin).encode())[:10] for vin in unique_vins}
+            self.cleaned_data['VIN_Hash'] = (
+                self.cleaned_data['VIN (1-10)'].map(vin_hashes).astype(object).fillna('Unknown')
             )
             print(f"  - Created VIN_Hash field for privacy")
 
@@ -326,35 +462,10 @@ class EVDataETL:
         print("Creating Location Dimension...")
 
         location_cols = ['County', 'City', 'State', 'Postal Code', 'Legislative District',
-                         '2020 Census Tract', 'Vehicle Location']
-
-        # Extract unique locations
-        location_data = self.cleaned_data[location_cols].drop_duplicates().reset_index(drop=True)
-
-        # Parse Vehicle Location into latitude and longitude
-        if 'Vehicle Location' in location_data.columns:
-            location_data['Latitude'] = None
-            location_data['Longitude'] = None
-
-            for idx, row in location_data.iterrows():
-                if pd.notna(row['Vehicle Location']) and row['Vehicle Location'] != 'Unknown':
-                    try:
-                        # Parse "POINT (longitude latitude)" format
-                        coords = row['Vehicle Location'].replace('POINT (', '').replace(')', '').split()
-                        if len(coords) == 2:
-                            location_data.loc[idx, 'Longitude'] = float(coords[0])
-                            location_data.loc[idx, 'Latitude'] = float(coords[1])
-                    except:
-                        pass  # Keep as None if parsing fails
-
-        # Create location_id as primary key
-        location_data['location_id'] = range(1, len(location_data) + 1)
-
-        # Reorder columns
-        dimension_cols = ['location_id', 'County', 'City', 'State', 'Postal Code',
-                          'Legislative District', '2020 Census Tract', 'Latitude', 'Longitude']
-
-        self.dimension_tables['dim_location'] = location_data[dimension_cols]
+                         '2020 Census Tract', 'Latitude', 'Longitude']
+
+        # Extract unique locations with location_id as primary key
+        self.dimension_tables['dim_location'] = self._factorize_dimension(location_cols, 'location_id')
         print(f"  - Created {len(self.dimension_tables['dim_location'])} unique locations")
 
     def _create_vehicle_dimension(self) -> None:
@@ -365,102 +476,93 @@ class EVDataETL:
                         'Clean Alternative Fuel Vehicle (CAFV) Eligibility',
                         'EV_Type_Code', 'CAFV_Code']
 
-        # Extract unique vehicle combinations
-        vehicle_data = self.cleaned_data[vehicle_cols].drop_duplicates().reset_index(drop=True)
-
-        # Create vehicle_id as primary key
-        vehicle_data['vehicle_id'] = range(1, len(vehicle_data) + 1)
-
-        # Reorder columns
-        dimension_cols = ['vehicle_id', 'Make', 'Model', 'Electric Vehicle Type',
-                          'Clean Alternative Fuel Vehicle (CAFV) Eligibility',
-                          'EV_Type_Code', 'CAFV_Code']
-
-        self.dimension_tables['dim_vehicle'] = vehicle_data[dimension_cols]
+        # Extract unique vehicle combinations with vehicle_id as primary key
+        self.dimension_tables['dim_vehicle'] = self._factorize_dimension(vehicle_cols, 'vehicle_id')
         print(f"  - Created {len(self.dimension_tables['dim_vehicle'])} unique vehicle types")
 
     def _create_utility_dimension(self) -> None:
         """Create utility dimension table"""
         print("Creating Utility Dimension...")
 
-        # Extract unique utilities
-        utility_data = self.cleaned_data[['Electric Utility']].drop_duplicates().reset_index(drop=True)
-
-        # Create utility_id as primary key
-        utility_data['utility_id'] = range(1, len(utility_data) + 1)
-
-        # Reorder columns
-        self.dimension_tables['dim_utility'] = utility_data[['utility_id', 'Electric Utility']]
+        # Extract unique utilities with utility_id as primary key
+        self.dimension_tables['dim_utility'] = self._factorize_dimension(['Electric Utility'], 'utility_id')
         print(f"  - Created {len(self.dimension_tables['dim_utility'])} unique utilities")
 
     def _create_time_dimension(self) -> None:
         """Create time dimension table"""
         print("Creating Time Dimension...")
 
-        # Extract unique model years and derived time fields
+        # Extract unique model years and derived time fields with time_id as primary key
         time_cols = ['Model Year', 'Model_Decade', 'Year_Category']
-        time_data = self.cleaned_data[time_cols].drop_duplicates().reset_index(drop=True)
+        self.dimension_tables['dim_time'] = self._factorize_dimension(time_cols, 'time_id')
+        print(f"  - Created {len(self.dimension_tables['dim_time'])} unique time periods")
 
-        # Create time_id as primary key
-        time_data['time_id'] = range(1, len(time_data) + 1)
+    def _factorize_dimension(self, key_cols: List[str], id_col: str) -> pd.DataFrame:
+        """
+        Factorize the composite key of a dimension into unique rows and foreign keys
 
-        # Reorder columns
-        dimension_cols = ['time_id', 'Model Year', 'Model_Decade', 'Year_Category']
+        A single pass yields both the unique key combinations, which become the
+        dimension rows, and each record's code, which is kept as its foreign key
+        so the fact table needs no joins.
 
-        self.dimension_tables['dim_time'] = time_data[dimension_cols]
-        print(f"  - Created {len(self.dimension_tables['dim_time'])} unique time periods")
+        Args:
+            key_cols (List[str]): Columns forming the dimension's natural key
+            id_col (str): Name of the surrogate key column
+
+        Returns:
+            pd.DataFrame: Surrogate key column followed by the unique key combinations
+        """
+        key_data = self.cleaned_data[key_cols]
+
+        if any(isinstance(dtype, pd.CategoricalDtype) for dtype in key_data.dtypes):
+            # Pack the integer category codes of each row into one int64 key and hash-factorize
+            # it, which avoids pandas' slow categorical hashing path. When the key space
+            # would overflow, the partial key is compacted to its dense codes first.
+            key = np.zeros(len(key_data), dtype=np.int64)
+            key_space = 1
+            for col in key_cols:
+                cat = pd.Categorical(key_data[col])
+                base = len(cat.categories) + 1
+                if key_space > np.iinfo(np.int64).max // base:
+                    key, partial_uniques = pd.factorize(key)
+                    key_space = len(partial_uniques)
+                key = key * base + (cat.codes.astype(np.int64) + 1)
+                key_space *= base
+            codes, _ = pd.factorize(key)
+
+            # Codes are assigned in first-seen order, so a row is the first occurrence of its
+            # combination exactly where the running maximum code increases
+            first_rows = np.flatnonzero(np.diff(np.maximum.accumulate(codes), prepend=-1))
+            dimension_data = key_data.iloc[first_rows].reset_index(drop=True)
+        else:
+            codes, uniques = pd.MultiIndex.from_frame(key_data).factorize()
+            dimension_data = uniques.to_frame(index=False, name=key_cols)
+
+        dimension_data.insert(0, id_col, np.arange(1, len(dimension_data) + 1, dtype='int32'))
+        self._foreign_keys[id_col] = codes.astype('int32') + 1
+
+        return dimension_data
 
     def _create_fact_table(self) -> None:
-        """Create fact table by joining with dimension tables"""
+        """Create fact table from the dimension foreign keys and measures"""
         print("Creating Fact Table...")
 
-        # Start with the main dataset
-        fact_data = self.cleaned_data.copy()
-
-        # Join with location dimension to get location_id
-        fact_data = fact_data.merge(
-            self.dimension_tables['dim_location'],
-            on=['County', 'City', 'State', 'Postal Code', 'Legislative District', '2020 Census Tract'],
-            how='left'
-        )
-
-        # Join with vehicle dimension to get vehicle_id
-        fact_data = fact_data.merge(
-            self.dimension_tables['dim_vehicle'],
-            on=['Make', 'Model', 'Electric Vehicle Type',
-                'Clean Alternative Fuel Vehicle (CAFV) Eligibility',
-                'EV_Type_Code', 'CAFV_Code'],
-            how='left'
-        )
-
-        # Join with utility dimension to get utility_id
-        fact_data = fact_data.merge(
-            self.dimension_tables['dim_utility'],
-            on=['Electric Utility'],
-            how='left'
-        )
-
-        # Join with time dimension to get time_id
-        fact_data = fact_data.merge(
-            self.dimension_tables['dim_time'],
-            on=['Model Year', 'Model_Decade', 'Year_Category'],
-            how='left'
-        )
-
-        # Create fact table with measures and foreign keys
-        fact_cols = ['location_id', 'vehicle_id', 'utility_id', 'time_id',
-                     'Base MSRP', 'Electric Range', 'DOL Vehicle ID', 'VIN_Hash']
-
-        self.fact_table = fact_data[fact_cols].copy()
+        measure_cols = ['Base MSRP', 'Electric Range', 'DOL Vehicle ID', 'VIN_Hash']
 
         # Create a unique registration_id for each record
-        self.fact_table['registration_id'] = range(1, len(self.fact_table) + 1)
+        fact_data = {'registration_id': np.arange(1, len(self.cleaned_data) + 1)}
+
+        # Foreign keys come straight from the dimension factorization (no joins needed)
+        for id_col in ['location_id', 'vehicle_id', 'utility_id', 'time_id']:
+            fact_data[id_col] = self._foreign_keys[id_col]
+
+        for col in measure_cols:
+            fact_data[col] = self.cleaned_data[col].to_numpy()
 
-        # Reorder columns to put registration_id first
-        final_cols = ['registration_id'] + fact_cols
-        self.fact_table = self.fact_table[final_cols]
+        self.fact_table = pd.DataFrame(fact_data)
+        self._fact_shape = self.fact_table.shape
 
-        print(f"  - Created fact table with {len(self.fact_table)} registrations")
+        print(f"  - Created fact table with {self._fact_shape[0]} registrations")
 
     def load_to_warehouse(self, db_path: str = 'ev_data_warehouse.db') -> None:
         """
@@ -475,28 +577,73 @@ class EVDataETL:
         if not self.dimension_tables or self.fact_table is None:
             raise ValueError("No dimensional model available. Please create dimensional model first.")
 
-        # Create SQLite connection
-        conn = sqlite3.connect(db_path)
+        # Create SQLite connection; transactions are opened explicitly around the bulk inserts
+        conn = adbc_sqlite.connect(db_path, autocommit=True)
 
         try:
-            # Load dimension tables
-            for table_name, table_data in self.dimension_tables.items():
-                table_data.to_sql(table_name, conn, if_exists='replace', index=False)
-                print(f"Loaded {table_name}: {len(table_data)} records")
+            with conn.cursor() as cursor:
+                self._configure_bulk_load(cursor)
+
+                cursor.execute("BEGIN")
+
+                # Load dimension tables
+                for table_name, table_data in self.dimension_tables.items():
+                    self._ingest_table(cursor, table_name, table_data)
+                    print(f"Loaded {table_name}: {len(table_data)} records")
+
+                # Load fact table
+                self._ingest_table(cursor, 'fact_vehicle_registration', self.fact_table)
+                print(f"Loaded fact_vehicle_registration: {len(self.fact_table)} records")
 
-            # Load fact table
-            self.fact_table.to_sql('fact_vehicle_registration', conn, if_exists='replace', index=False)
-            print(f"Loaded fact_vehicle_registration: {len(self.fact_table)} records")
+                cursor.execute("COMMIT")
 
-            # Create indexes for better performance
-            self._create_indexes(conn)
+                # Create indexes after all inserts for better performance
+                self._create_indexes(cursor)
 
             print(f"\nData warehouse successfully created at: {db_path}")
 
         finally:
             conn.close()
 
-    def _create_indexes(self, conn: sqlite3.Connection) -> None:
+    def _ingest_table(self, cursor: adbc_sqlite.Cursor, table_name: str, table_data: pd.DataFrame,
+                      mode: str = 'replace') -> pa.Table:
+        """
+        Write a DataFrame to SQLite as Arrow record batches, without per-row Python binding
+
+        Args:
+            cursor (adbc_sqlite.Cursor): Cursor of the warehouse connection
+            table_name (str): Name of the target table
+            table_data (pd.DataFrame): Rows to write
+            mode (str): ADBC ingest mode, 'replace' or 'append'
+
+        Returns:
+            pa.Table: The Arrow table that was ingested
+        """
+        table = pa.Table.from_pandas(table_data, preserve_index=False)
+
+        # Categories arrive as dictionary columns, which ADBC would create without a
+        # declared type; decode them so they get the same TEXT affinity as plain strings
+        table = table.cast(pa.schema([
+            field.with_type(field.type.value_type) if pa.types.is_dictionary(field.type) else field
+            for field in table.schema
+        ]))
+
+        cursor.adbc_ingest(table_name, table, mode=mode)
+
+        return table
+
+    def _configure_bulk_load(self, cursor: adbc_sqlite.Cursor) -> None:
+        """Relax durability for the bulk load; the warehouse is rebuilt from source on failure"""
+        bulk_load_pragmas = [
+            "PRAGMA journal_mode=MEMORY",
+            "PRAGMA synchronous=OFF",
+            "PRAGMA temp_store=MEMORY",
+            "PRAGMA cache_size=-200000"
+        ]
+        for pragma in bulk_load_pragmas:
+            cursor.execute(pragma)
+
+    def _create_indexes(self, cursor: adbc_sqlite.Cursor) -> None:
         """Create indexes on foreign keys and commonly queried columns"""
         print("Creating database indexes...")
 
@@ -511,21 +658,237 @@ class EVDataETL:
         ]
 
         for query in index_queries:
-            conn.execute(query)
+            cursor.execute(query)
 
-        conn.commit()
         print("  - Database indexes created")
 
-    def export_to_csv(self, output_dir: str = 'data_warehouse_output') -> None:
+        # Refresh query planner statistics now that the tables are populated
+        cursor.execute("ANALYZE")
+
+    def run_streaming(self, db_path: str = 'ev_data_warehouse.db', chunksize: int = 200_000,
+                      parquet_dir: Optional[str] = None) -> None:
+        """
+        Run the full ETL over CSV chunks so the dataset is never held in memory at once
+
+        Exploration statistics are accumulated incrementally, dimension rows are kept
+        as growing key -> id mappings, and fact rows are streamed straight into SQLite.
+        Missing Electric Range values are filled with the median of their own chunk.
+        Since the fact table is never materialized, a Parquet copy of it can only be
+        written here, one row group per chunk.
+
+        Args:
+            db_path (str): Path to the SQLite database file
+            chunksize (int): Number of CSV rows processed per chunk
+            parquet_dir (Optional[str]): Directory to also write the fact table to as Parquet
+        """
+        print("\nSTREAMING ETL PIPELINE")
+        print("=" * 50)
+
+        feature_stats = {col: {} for col in ['Model Year', 'Electric Range', 'Base MSRP']}
+        missing_counts = None
+        dimension_ids = {}
+        dimension_columns = {}
+        total_rows = 0
+        fact_writer = None
+
+        conn = adbc_sqlite.connect(db_path, autocommit=True)
+
+        try:
+            with conn.cursor() as cursor:
+                self._configure_bulk_load(cursor)
+
+                for chunk_number, chunk in enumerate(self._read_chunks(chunksize), start=1):
+                    print(f"\nProcessing chunk {chunk_number} ({len(chunk):,} records)...")
+
+                    # Explore: accumulate statistics on the raw chunk
+                    chunk_missing = chunk.isna().sum()
+                    missing_counts = chunk_missing if missing_counts is None else missing_counts + chunk_missing
+                    self._update_running_stats(feature_stats['Model Year'], chunk['Model Year'].dropna())
+                    for col in ['Electric Range', 'Base MSRP']:
+                        values = chunk[col].dropna()
+                        self._update_running_stats(feature_stats[col], values[values > 0])
+
+                    # Transform and build the chunk-local dimensional model
+                    self.cleaned_data = chunk
+                    self._handle_missing_values()
+                    self._encode_categorical_variables()
+                    self._create_derived_fields()
+                    self._create_location_dimension()
+                    self._create_vehicle_dimension()
+                    self._create_utility_dimension()
+                    self._create_time_dimension()
+                    self._create_fact_table()
+
+                    # Translate chunk-local dimension ids into pipeline-wide ids
+                    for table_name, table_data in self.dimension_tables.items():
+                        id_col = table_data.columns[0]
+                        global_ids = self._map_to_global_ids(table_data, dimension_ids.setdefault(table_name, {}))
+                        self.fact_table[id_col] = global_ids[self.fact_table[id_col].to_numpy() - 1]
+                        dimension_columns[table_name] = list(table_data.columns)
+
+                    self.fact_table['registration_id'] += total_rows
+                    total_rows += len(self.fact_table)
+
+                    # Stream fact rows into the warehouse (and the Parquet export, if requested)
+                    fact_chunk = self._ingest_table(cursor, 'fact_vehicle_registration', self.fact_table,
+                                                    mode='replace' if chunk_number == 1 else 'append')
+                    if parquet_dir is not None:
+                        if fact_writer is None:
+                            fact_writer = self._open_fact_parquet_writer(parquet_dir, fact_chunk.schema)
+                        fact_writer.write_table(fact_chunk)
+                    print(f"  - Loaded {total_rows:,} fact records so far")
+
+                self._raw_shape = (total_rows, chunk.shape[1])
+                self._cleaned_shape = (total_rows, self.cleaned_data.shape[1])
+                self._fact_shape = (total_rows, self.fact_table.shape[1])
+                self.cleaned_data = None
+                self.fact_table = None
+
+                # Report exploration results for the whole dataset
+                print("\nEXPLORING DATA CHARACTERISTICS")
+                print("=" * 50)
+                print(f"Dataset Info:")
+                print(f"- Shape: {self._raw_shape}")
+                self._print_missing_values(missing_counts, total_rows)
+                for col, stats in feature_stats.items():
+                    self._print_feature_stats(col, self._summarize_running_stats(stats))
+
+                # Materialize the final dimension tables and load them
+                for table_name, ids in dimension_ids.items():
+                    id_col, *value_cols = dimension_columns[table_name]
+                    table_data = pd.DataFrame(list(ids), columns=value_cols)
+                    table_data.insert(0, id_col, list(ids.values()))
+                    self.dimension_tables[table_name] = table_data
+
+                print(f"\nLOADING TO DATA WAREHOUSE")
+                print("=" * 50)
+                cursor.execute("BEGIN")
+                for table_name, table_data in self.dimension_tables.items():
+                    self._ingest_table(cursor, table_name, table_data)
+                    print(f"Loaded {table_name}: {len(table_data)} records")
+                cursor.execute("COMMIT")
+                print(f"Loaded fact_vehicle_registration: {total_rows} records")
+
+                self._create_indexes(cursor)
+
+            print(f"\nData warehouse successfully created at: {db_path}")
+
+        finally:
+            if fact_writer is not None:
+                fact_writer.close()
+            conn.close()
+
+    def _open_fact_parquet_writer(self, output_dir: str, schema: pa.Schema) -> pa_parquet.ParquetWriter:
         """
-        Export all tables to CSV files
+        Open the fact table's Parquet file for chunk-by-chunk writing
 
         Args:
-            output_dir (str): Directory to save CSV files
+            output_dir (str): Directory to save the Parquet file
+            schema (pa.Schema): Schema of the first fact chunk
+
+        Returns:
+            pa_parquet.ParquetWriter: Writer for fact_vehicle_registration.parquet
         """
         import os
 
-        print(f"\nEXPORTING TO CSV FILES")
+        os.makedirs(output_dir, exist_ok=True)
+
+        self._fact_parquet_path = os.path.join(output_dir, "fact_vehicle_registration.parquet")
+
+        return pa_parquet.ParquetWriter(self._fact_parquet_path, schema, compression='zstd')
+
+    def _read_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Stream the source CSV and yield it as DataFrame chunks"""
+        with self._open_source() as source:
+            for chunk in pd.read_csv(
+                source,
+                engine='c',
+                usecols=KEEP_COLS,
+                dtype=DTYPES,
+                chunksize=chunksize
+            ):
+                yield self._parse_vehicle_location(self._downcast_numeric_columns(chunk))
+
+    def _update_running_stats(self, stats: Dict, values: pd.Series) -> None:
+        """Merge a chunk of values into running count/mean/M2 (Welford), min/max and value counts"""
+        count = len(values)
+        if count == 0:
+            return
+
+        as_float = values.astype('float64')
+        chunk_mean = as_float.mean()
+        chunk_m2 = ((as_float - chunk_mean) ** 2).sum()
+
+        # Combine the chunk with the running totals (parallel form of Welford's algorithm)
+        total = stats.get('count', 0) + count
+        delta = chunk_mean - stats.get('mean', 0.0)
+        stats['mean'] = stats.get('mean', 0.0) + delta * count / total
+        stats['m2'] = stats.get('m2', 0.0) + chunk_m2 + delta ** 2 * stats.get('count', 0) * count / total
+        stats['count'] = total
+        stats['min'] = min(stats.get('min', values.min()), values.min())
+        stats['max'] = max(stats.get('max', values.max()), values.max())
+        stats.setdefault('counts', Counter()).update(values.value_counts().to_dict())
+
+    def _counter_quantile(self, counts: Counter, q: float) -> float:
+        """Linearly interpolated quantile of the values recorded in a Counter"""
+        values = sorted(counts)
+        position = q * (sum(counts.values()) - 1)
+        lower, upper = int(np.floor(position)), int(np.ceil(position))
+
+        cumulative = np.cumsum([counts[v] for v in values])
+        lower_value = values[np.searchsorted(cumulative, lower, side='right')]
+        upper_value = values[np.searchsorted(cumulative, upper, side='right')]
+
+        return lower_value + (upper_value - lower_value) * (position - lower)
+
+    def _summarize_running_stats(self, stats: Dict) -> Dict:
+        """Turn running statistics into the summary printed by _print_feature_stats"""
+        if not stats:
+            return {'count': 0}
+
+        counts = stats['counts']
+        variance = stats['m2'] / (stats['count'] - 1) if stats['count'] > 1 else np.nan
+
+        return {
+            'count': stats['count'],
+            'mean': stats['mean'],
+            'median': self._counter_quantile(counts, 0.5),
+            'mode': counts.most_common(1)[0][0],
+            'min': stats['min'],
+            'max': stats['max'],
+            'q1': self._counter_quantile(counts, 0.25),
+            'q3': self._counter_quantile(counts, 0.75),
+            'std': np.sqrt(variance),
+            'var': variance
+        }
+
+    def _map_to_global_ids(self, table_data: pd.DataFrame, ids: Dict[tuple, int]) -> np.ndarray:
+        """
+        Look up (or assign, in first-seen order) the pipeline-wide id of each dimension row
+
+        Args:
+            table_data (pd.DataFrame): Chunk-local dimension table with its id as first column
+            ids (Dict[tuple, int]): Running mapping of dimension row values to ids
+
+        Returns:
+            np.ndarray: Global id of each row of table_data
+        """
+        keys = table_data.iloc[:, 1:].astype(object)
+        keys = keys.where(keys.notna(), None)
+
+        return np.array([ids.setdefault(key, len(ids) + 1)
+                         for key in keys.itertuples(index=False, name=None)])
+
+    def export_to_parquet(self, output_dir: str = 'data_warehouse_output') -> None:
+        """
+        Export all tables to Parquet files
+
+        Args:
+            output_dir (str): Directory to save Parquet files
+        """
+        import os
+
+        print(f"\nEXPORTING TO PARQUET FILES")
         print("=" * 50)
 
         # Create output directory
@@ -533,15 +896,21 @@ class EVDataETL:
 
         # Export dimension tables
         for table_name, table_data in self.dimension_tables.items():
-            file_path = os.path.join(output_dir, f"{table_name}.csv")
-            table_data.to_csv(file_path, index=False)
+            file_path = os.path.join(output_dir, f"{table_name}.parquet")
+            table_data.to_parquet(file_path, engine='pyarrow', compression='zstd', index=False)
             print(f"Exported {table_name}: {file_path}")
 
-        # Export fact table
+        # Export fact table with large row groups for analytical scans
         if self.fact_table is not None:
-            file_path = os.path.join(output_dir, "fact_vehicle_registration.csv")
-            self.fact_table.to_csv(file_path, index=False)
+            file_path = os.path.join(output_dir, "fact_vehicle_registration.parquet")
+            self.fact_table.to_parquet(file_path, engine='pyarrow', compression='zstd', index=False,
+                                       row_group_size=500_000)
             print(f"Exported fact_vehicle_registration: {file_path}")
+        elif self._fact_parquet_path is not None:
+            print(f"Exported fact_vehicle_registration: {self._fact_parquet_path} (written while streaming)")
+        else:
+            print("Skipped fact_vehicle_registration: streamed fact rows are not kept in memory "
+                  "(pass parquet_dir to run_streaming to export them)")
 
         print(f"\nAll files exported to: {output_dir}")
 
@@ -550,34 +919,36 @@ class EVDataETL:
         print(f"\nETL PROCESS SUMMARY REPORT")
         print("=" * 50)
 
-        if self.raw_data is not None:
+        if self._raw_shape is not None:
             print(f"Source Data:")
-            print(f"  - Records extracted: {len(self.raw_data):,}")
-            print(f"  - Columns: {len(self.raw_data.columns)}")
+            print(f"  - Records extracted: {self._raw_shape[0]:,}")
+            print(f"  - Columns: {self._raw_shape[1]}")
 
-        if self.cleaned_data is not None:
+        if self._cleaned_shape is not None:
             print(f"\nCleaned Data:")
-            print(f"  - Records after cleaning: {len(self.cleaned_data):,}")
-            print(f"  - Data quality: {((len(self.cleaned_data) / len(self.raw_data)) * 100):.1f}% retention")
+            print(f"  - Records after cleaning: {self._cleaned_shape[0]:,}")
+            print(f"  - Data quality: {((self._cleaned_shape[0] / self._raw_shape[0]) * 100):.1f}% retention")
 
         if self.dimension_tables:
             print(f"\nDimensional Model:")
             for table_name, table_data in self.dimension_tables.items():
                 print(f"  - {table_name}: {len(table_data):,} records")
 
-        if self.fact_table is not None:
-            print(f"  - fact_vehicle_registration: {len(self.fact_table):,} records")
+        if self._fact_shape is not None:
+            print(f"  - fact_vehicle_registration: {self._fact_shape[0]:,} records")
 
         print(f"\nETL Process completed successfully!")
 
 
-def main(export_csv: bool = False):
+def main(export_parquet: bool = False, streaming: bool = False):
     """
     Main execution function for the ETL pipeline
     
     Args:
-        export_csv (bool): Whether to export dimensional tables to CSV files. 
-                          Default False - focuses on core requirement of loading to data warehouse.
+        export_parquet (bool): Whether to export dimensional tables to Parquet files.
+                              Default False - focuses on core requirement of loading to data warehouse.
+        streaming (bool): Whether to process the dataset in chunks with bounded memory.
+                          Default False - loads the full dataset into memory.
     """
     print("ELECTRIC VEHICLE DATA WAREHOUSE ETL")
     print("=" * 60)
@@ -595,27 +966,31 @@ def main(export_csv: bool = False):
         # Execute ETL Pipeline
         print("\nStarting ETL Pipeline...")
 
-        # 1. Extract
-        etl.extract_data()
+        if streaming:
+            # 1-5. Extract, explore, transform, model and load chunk by chunk
+            etl.run_streaming(parquet_dir='data_warehouse_output' if export_parquet else None)
+        else:
+            # 1. Extract
+            etl.extract_data()
 
-        # 2. Explore  
-        etl.explore_data()
+            # 2. Explore
+            etl.explore_data()
 
-        # 3. Transform
-        etl.clean_and_transform()
+            # 3. Transform
+            etl.clean_and_transform()
 
-        # 4. Create Dimensional Model
-        etl.create_dimensional_model()
+            # 4. Create Dimensional Model
+            etl.create_dimensional_model()
 
-        # 5. Load to Data Warehouse (CORE REQUIREMENT)
-        etl.load_to_warehouse()
+            # 5. Load to Data Warehouse (CORE REQUIREMENT)
+            etl.load_to_warehouse()
 
-        # 6. Export to CSV (OPTIONAL - for inspection/analysis)
-        if export_csv:
-            print("\nExporting dimensional tables to CSV files...")
-            etl.export_to_csv()
+        # 6. Export to Parquet (OPTIONAL - for inspection/analysis)
+        if export_parquet:
+            print("\nExporting dimensional tables to Parquet files...")
+            etl.export_to_parquet()
         else:
-            print("\nSkipping CSV export (use export_csv=True to enable)")
+            print("\nSkipping Parquet export (use export_parquet=True to enable)")
 
         # 7. Generate Summary
         etl.generate_summary_report()
@@ -624,7 +999,7 @@ def main(export_csv: bool = False):
         print("ETL PIPELINE COMPLETED SUCCESSFULLY")
         print("="*60)
         print("✅ Data successfully loaded into SQLite data warehouse: ev_data_warehouse.db")
-        if export_csv:
+        if export_parquet:
             print("✅ Dimensional tables exported to: data_warehouse_output/")
         print("✅ Star schema with 4 dimensions + 1 fact table created")
 